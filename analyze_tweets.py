@@ -1,25 +1,282 @@
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from wordcloud import WordCloud
 import json
 from collections import Counter
 import re
+import os
+import sys
+import csv
+import hashlib
+import inspect
+import warnings
 from datetime import datetime
 
 # Set style
 sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 6)
 
-# Load the dataset
-df = pd.read_csv('mental_health_tweets.csv')
-df['date'] = pd.to_datetime(df['date'])
-df['year_month'] = df['date'].dt.to_period('M')
+SOURCE_CSV = 'mental_health_tweets.csv'
+CHECKPOINT_DIR = 'checkpoints'
+MANIFEST_PATH = os.path.join(CHECKPOINT_DIR, 'manifest.json')
+PARSED_DATA_PATH = os.path.join(CHECKPOINT_DIR, 'parsed_tweets.pkl')
+QUARANTINE_PATH = os.path.join(CHECKPOINT_DIR, 'quarantined_rows.csv')
+EXPECTED_COLUMNS = ['date', 'tweet_text', 'sentiment', 'category', 'likes', 'retweets', 'location']
+VALID_SENTIMENTS = {'positive', 'negative', 'neutral'}
+MAX_COUNT = np.iinfo('int64').max
+DATE_FORMAT = '%Y-%m-%d'
+# Abort instead of quarantining when this share of rows is invalid - it
+# almost always means the file's format changed rather than a few bad rows
+MAX_QUARANTINE_FRACTION = 0.5
+ENGAGEMENT_METRICS = ['likes', 'retweets']
+ENGAGEMENT_QUANTILES = {'median': 0.5, 'p90': 0.9, 'p99': 0.99}
+TOP_K_TWEETS = 5
+# Bump a stage's version whenever its plotting or aggregation code changes so
+# resumed runs regenerate it. The load stage is versioned automatically from
+# the source of read_tweets_csv and the validation constants.
+STAGE_VERSIONS = {
+    'sentiment_distribution': 1,
+    'category_distribution': 1,
+    'timeline': 1,
+    'sentiment_timeline': 1,
+    'engagement': 1,
+    'wordcloud': 1,
+    'location_distribution': 1,
+    'category_timeline': 1,
+    'summary_stats': 1,
+}
+
+# Create output directories for visualizations and checkpoints
+for directory in ('visualizations', CHECKPOINT_DIR):
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+
+# Checkpoint helpers - every artifact is written to a temp file and then
+# renamed into place, so a crash never leaves a half-written output behind.
+def replace_durably(tmp_path, path):
+    # Flush the temp file to disk before the rename so the manifest can never
+    # point at an output that is not actually on disk yet
+    with open(tmp_path, 'rb') as f:
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def atomic_write_json(path, data, **kwargs):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, **kwargs)
+    replace_durably(tmp_path, path)
+
+
+def atomic_savefig(path, **kwargs):
+    root, ext = os.path.splitext(path)
+    tmp_path = f'{root}.tmp{ext}'
+    plt.savefig(tmp_path, **kwargs)
+    replace_durably(tmp_path, path)
+
+
+def source_fingerprint():
+    stat = os.stat(SOURCE_CSV)
+    return {'path': SOURCE_CSV, 'size': stat.st_size, 'mtime': stat.st_mtime}
+
+
+def load_fingerprint():
+    parser = (inspect.getsource(read_tweets_csv)
+              + repr((EXPECTED_COLUMNS, sorted(VALID_SENTIMENTS), MAX_COUNT,
+                      DATE_FORMAT, MAX_QUARANTINE_FRACTION)))
+    return hashlib.sha256(parser.encode()).hexdigest()
+
+
+def stage_version(name):
+    if name == 'load':
+        return load_fingerprint()
+    if name.startswith('wordcloud_'):
+        return STAGE_VERSIONS['wordcloud']
+    return STAGE_VERSIONS[name]
+
+
+def load_manifest():
+    """Return the checkpoint manifest, discarding it if the source CSV changed."""
+    fresh = {'source': source_fingerprint(), 'stages': {}}
+    if '--fresh' in sys.argv or not os.path.exists(MANIFEST_PATH):
+        return fresh
+    try:
+        with open(MANIFEST_PATH) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return fresh
+    if manifest.get('source') != fresh['source']:
+        print("Source data changed since last run - starting from scratch.")
+        return fresh
+    return manifest
+
+
+skipped_stages = []
+
+
+def stage_done(name):
+    record = manifest['stages'].get(name)
+    if not isinstance(record, dict):
+        return False
+    if record.get('version') != stage_version(name):
+        print(f"Re-running {name} (its code changed since the last run)")
+        return False
+    if not all(os.path.exists(path) for path in record['outputs']):
+        return False
+    print(f"Skipping {name} (already completed in a previous run)")
+    skipped_stages.append(name)
+    return True
+
+
+def complete_stage(name, outputs):
+    manifest['stages'][name] = {'version': stage_version(name), 'outputs': outputs}
+    atomic_write_json(MANIFEST_PATH, manifest, indent=2)
+
+
+def read_bad_records(path, line_numbers):
+    """Return {line: fields} for the given CSV record numbers (the header is 1)."""
+    wanted = set(line_numbers)
+    records = {}
+    with open(path, newline='') as f:
+        for line, fields in enumerate(csv.reader(f), start=1):
+            if line in wanted:
+                records[line] = fields
+                if len(records) == len(wanted):
+                    break
+    return records
+
+
+def read_tweets_csv(path):
+    """Read the tweets CSV, quarantining rows that cannot be parsed or validated.
+
+    Lines with the wrong number of fields are skipped by the C parser with a
+    warning; their line numbers are taken from the warnings and the lines are
+    re-read with the csv module so they can be quarantined too.
+    """
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always', pd.errors.ParserWarning)
+        raw = pd.read_csv(path, dtype=str, keep_default_na=False, on_bad_lines='warn')
+    bad_line_numbers = sorted(int(n) for w in caught if issubclass(w.category, pd.errors.ParserWarning)
+                              for n in re.findall(r'Skipping line (\d+)', str(w.message)))
+    bad_lines = read_bad_records(path, bad_line_numbers) if bad_line_numbers else {}
+
+    missing = [col for col in EXPECTED_COLUMNS if col not in raw.columns]
+    if missing:
+        raise ValueError(f"{path} is missing required columns: {missing}")
+
+    # Only the converted columns are materialized; text columns are used
+    # straight from `raw` so the strings are not held twice
+    converted = {
+        'date': pd.to_datetime(raw['date'], format=DATE_FORMAT, errors='coerce'),
+        'likes': pd.to_numeric(raw['likes'], errors='coerce'),
+        'retweets': pd.to_numeric(raw['retweets'], errors='coerce'),
+    }
+
+    def valid_count(values):
+        # Counts must be whole, non-negative and fit the int64 cast below
+        return np.isfinite(values) & (values >= 0) & (values < MAX_COUNT) & (values % 1 == 0)
+
+    def has_text(col):
+        # Rows with too few fields are padded with NaN rather than reported as bad lines
+        return raw[col].notna() & (raw[col] != '')
+
+    valid = (converted['date'].notna()
+             & valid_count(converted['likes'])
+             & valid_count(converted['retweets'])
+             & raw['sentiment'].isin(VALID_SENTIMENTS)
+             & has_text('tweet_text')
+             & has_text('category')
+             & has_text('location'))
+
+    # Map row positions back to source line numbers: line 1 is the header and
+    # every skipped bad line before a row shifts it down by one
+    quarantined = raw.loc[~valid, EXPECTED_COLUMNS].fillna('')
+    positions = np.flatnonzero(~valid.to_numpy())
+    skipped_before = np.searchsorted(np.array(bad_line_numbers) - 2 - np.arange(len(bad_line_numbers)),
+                                     positions, side='right')
+    rejected = [(line, list(fields)) for line, fields in
+                zip((positions + 2 + skipped_before).tolist(), quarantined.itertuples(index=False))]
+    rejected += bad_lines.items()
+    with open(QUARANTINE_PATH + '.tmp', 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['line'] + EXPECTED_COLUMNS)
+        writer.writerows([line] + fields for line, fields in sorted(rejected))
+    replace_durably(QUARANTINE_PATH + '.tmp', QUARANTINE_PATH)
+
+    n_bad = len(quarantined) + len(bad_lines)
+    if n_bad:
+        print(f"Quarantined {n_bad} malformed rows to {QUARANTINE_PATH}")
+    n_total = len(raw) + len(bad_lines)
+    if n_bad > MAX_QUARANTINE_FRACTION * n_total or not valid.any():
+        raise ValueError(f"{n_bad} of {n_total} rows in {path} are malformed - check the file format "
+                         f"(dates must be {DATE_FORMAT}); rejected rows are in {QUARANTINE_PATH}")
+
+    df = pd.DataFrame({col: converted[col][valid] if col in converted else raw[col][valid]
+                       for col in EXPECTED_COLUMNS}).reset_index(drop=True)
+    df['likes'] = df['likes'].astype('int64')
+    df['retweets'] = df['retweets'].astype('int64')
+    df['year_month'] = df['date'].dt.to_period('M')
+    return df
+
+
+def engagement_stats(df, keys):
+    """Count, mean and quantiles of likes/retweets for every group of `keys`.
+
+    All statistics come from one groupby, so the group keys are only
+    factorized once however many quantiles are requested.
+    """
+    grouped = df.groupby(keys, sort=True, observed=True)[ENGAGEMENT_METRICS]
+    quantile_names = {q: name for name, q in ENGAGEMENT_QUANTILES.items()}
+    quantiles = grouped.quantile(list(quantile_names)).unstack()
+    quantiles.columns = pd.MultiIndex.from_tuples(
+        [(metric, quantile_names[q]) for metric, q in quantiles.columns])
+    return grouped.agg(['count', 'mean']).join(quantiles)
+
+
+def engagement_records(stats):
+    """Flatten an engagement_stats() table into JSON-friendly records."""
+    keys = stats.index.names
+    records = []
+    for group, row in zip(stats.index, stats.round(2).to_dict('records')):
+        group = group if isinstance(group, tuple) else (group,)
+        record = dict(zip(keys, group))
+        record['count'] = int(row[(ENGAGEMENT_METRICS[0], 'count')])
+        for metric in ENGAGEMENT_METRICS:
+            record[metric] = {stat: value for (m, stat), value in row.items()
+                              if m == metric and stat != 'count'}
+        records.append(record)
+    return records
 
-# Create output directory for visualizations
-import os
-if not os.path.exists('visualizations'):
-    os.makedirs('visualizations')
+
+def top_tweets(df, metric, by='sentiment', k=TOP_K_TWEETS):
+    """The k tweets with the highest `metric` in each `by` group.
+
+    Uses nlargest (a partial selection) rather than sorting every row.
+    """
+    index = df.groupby(by, sort=True)[metric].nlargest(k).index.get_level_values(-1)
+    top = df.loc[index, ['date', 'tweet_text', by, 'category', 'location', 'likes', 'retweets']]
+    top['date'] = top['date'].dt.strftime('%Y-%m-%d')
+    return {group: rows.drop(columns=by).to_dict('records')
+            for group, rows in top.groupby(by, sort=True)}
+
+
+manifest = load_manifest()
+
+# Load the dataset (from the parsed checkpoint when available)
+if stage_done('load'):
+    print("Resuming from checkpoint...")
+    df = pd.read_pickle(PARSED_DATA_PATH)
+else:
+    # Every later stage is derived from the parsed data, so none of their
+    # checkpoints survive a re-parse
+    manifest['stages'] = {}
+    df = read_tweets_csv(SOURCE_CSV)
+    df.to_pickle(PARSED_DATA_PATH + '.tmp')
+    replace_durably(PARSED_DATA_PATH + '.tmp', PARSED_DATA_PATH)
+    complete_stage('load', [PARSED_DATA_PATH, QUARANTINE_PATH])
 
 print("Dataset loaded successfully!")
 print(f"Total tweets: {len(df)}")
@@ -27,247 +284,288 @@ print(f"Date range: {df['date'].min()} to {df['date'].max()}")
 print("\n" + "="*50 + "\n")
 
 # 1. Sentiment Distribution
-print("Generating Sentiment Distribution...")
-sentiment_counts = df['sentiment'].value_counts()
-plt.figure(figsize=(10, 6))
-colors = {'positive': '#2ecc71', 'negative': '#e74c3c', 'neutral': '#95a5a6'}
-sentiment_colors = [colors[sent] for sent in sentiment_counts.index]
-plt.bar(sentiment_counts.index, sentiment_counts.values, color=sentiment_colors, edgecolor='black', linewidth=1.5)
-plt.title('Distribution of Tweet Sentiments', fontsize=16, fontweight='bold')
-plt.xlabel('Sentiment', fontsize=12)
-plt.ylabel('Number of Tweets', fontsize=12)
-plt.grid(axis='y', alpha=0.3)
-for i, v in enumerate(sentiment_counts.values):
-    plt.text(i, v + 1, str(v), ha='center', fontweight='bold')
-plt.tight_layout()
-plt.savefig('visualizations/sentiment_distribution.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-# Save data for web visualization
-sentiment_data = {
-    'labels': sentiment_counts.index.tolist(),
-    'values': sentiment_counts.values.tolist(),
-    'colors': sentiment_colors
-}
-with open('visualizations/sentiment_data.json', 'w') as f:
-    json.dump(sentiment_data, f)
+if not stage_done('sentiment_distribution'):
+    print("Generating Sentiment Distribution...")
+    sentiment_counts = df['sentiment'].value_counts()
+    plt.figure(figsize=(10, 6))
+    colors = {'positive': '#2ecc71', 'negative': '#e74c3c', 'neutral': '#95a5a6'}
+    sentiment_colors = [colors[sent] for sent in sentiment_counts.index]
+    plt.bar(sentiment_counts.index, sentiment_counts.values, color=sentiment_colors, edgecolor='black', linewidth=1.5)
+    plt.title('Distribution of Tweet Sentiments', fontsize=16, fontweight='bold')
+    plt.xlabel('Sentiment', fontsize=12)
+    plt.ylabel('Number of Tweets', fontsize=12)
+    plt.grid(axis='y', alpha=0.3)
+    for i, v in enumerate(sentiment_counts.values):
+        plt.text(i, v + 1, str(v), ha='center', fontweight='bold')
+    plt.tight_layout()
+    atomic_savefig('visualizations/sentiment_distribution.png', dpi=300, bbox_inches='tight')
+    plt.close()
+
+    # Save data for web visualization
+    sentiment_data = {
+        'labels': sentiment_counts.index.tolist(),
+        'values': sentiment_counts.values.tolist(),
+        'colors': sentiment_colors
+    }
+    atomic_write_json('visualizations/sentiment_data.json', sentiment_data)
+    complete_stage('sentiment_distribution', ['visualizations/sentiment_distribution.png', 'visualizations/sentiment_data.json'])
 
 # 2. Category Distribution
-print("Generating Category Distribution...")
-category_counts = df['category'].value_counts()
-plt.figure(figsize=(12, 6))
-colors_cat = plt.cm.Set3(range(len(category_counts)))
-plt.barh(category_counts.index, category_counts.values, color=colors_cat, edgecolor='black')
-plt.title('Mental Health Categories in Tweets', fontsize=16, fontweight='bold')
-plt.xlabel('Number of Tweets', fontsize=12)
-plt.ylabel('Category', fontsize=12)
-plt.grid(axis='x', alpha=0.3)
-for i, v in enumerate(category_counts.values):
-    plt.text(v + 0.5, i, str(v), va='center', fontweight='bold')
-plt.tight_layout()
-plt.savefig('visualizations/category_distribution.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-# Save data for web
-category_data = {
-    'labels': category_counts.index.tolist(),
-    'values': category_counts.values.tolist()
-}
-with open('visualizations/category_data.json', 'w') as f:
-    json.dump(category_data, f)
+if not stage_done('category_distribution'):
+    print("Generating Category Distribution...")
+    category_counts = df['category'].value_counts()
+    plt.figure(figsize=(12, 6))
+    colors_cat = plt.cm.Set3(range(len(category_counts)))
+    plt.barh(category_counts.index, category_counts.values, color=colors_cat, edgecolor='black')
+    plt.title('Mental Health Categories in Tweets', fontsize=16, fontweight='bold')
+    plt.xlabel('Number of Tweets', fontsize=12)
+    plt.ylabel('Category', fontsize=12)
+    plt.grid(axis='x', alpha=0.3)
+    for i, v in enumerate(category_counts.values):
+        plt.text(v + 0.5, i, str(v), va='center', fontweight='bold')
+    plt.tight_layout()
+    atomic_savefig('visualizations/category_distribution.png', dpi=300, bbox_inches='tight')
+    plt.close()
+
+    # Save data for web
+    category_data = {
+        'labels': category_counts.index.tolist(),
+        'values': category_counts.values.tolist()
+    }
+    atomic_write_json('visualizations/category_data.json', category_data)
+    complete_stage('category_distribution', ['visualizations/category_distribution.png', 'visualizations/category_data.json'])
 
 # 3. Timeline Analysis - Tweets over time
-print("Generating Timeline Analysis...")
-timeline_data = df.groupby('year_month').size()
-plt.figure(figsize=(14, 6))
-timeline_data.plot(kind='line', marker='o', linewidth=2, markersize=8, color='#3498db')
-plt.title('Mental Health Tweet Volume Over Time (2020-2022)', fontsize=16, fontweight='bold')
-plt.xlabel('Month', fontsize=12)
-plt.ylabel('Number of Tweets', fontsize=12)
-plt.grid(True, alpha=0.3)
-plt.xticks(rotation=45)
-plt.tight_layout()
-plt.savefig('visualizations/timeline_tweets.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-# Save timeline data
-timeline_json = {
-    'dates': [str(date) for date in timeline_data.index],
-    'counts': timeline_data.values.tolist()
-}
-with open('visualizations/timeline_data.json', 'w') as f:
-    json.dump(timeline_json, f)
+if not stage_done('timeline'):
+    print("Generating Timeline Analysis...")
+    timeline_data = df.groupby('year_month').size()
+    plt.figure(figsize=(14, 6))
+    timeline_data.plot(kind='line', marker='o', linewidth=2, markersize=8, color='#3498db')
+    plt.title('Mental Health Tweet Volume Over Time (2020-2022)', fontsize=16, fontweight='bold')
+    plt.xlabel('Month', fontsize=12)
+    plt.ylabel('Number of Tweets', fontsize=12)
+    plt.grid(True, alpha=0.3)
+    plt.xticks(rotation=45)
+    plt.tight_layout()
+    atomic_savefig('visualizations/timeline_tweets.png', dpi=300, bbox_inches='tight')
+    plt.close()
+
+    # Save timeline data
+    timeline_json = {
+        'dates': [str(date) for date in timeline_data.index],
+        'counts': timeline_data.values.tolist()
+    }
+    atomic_write_json('visualizations/timeline_data.json', timeline_json)
+    complete_stage('timeline', ['visualizations/timeline_tweets.png', 'visualizations/timeline_data.json'])
 
 # 4. Sentiment Timeline
-print("Generating Sentiment Timeline...")
-sentiment_timeline = df.groupby(['year_month', 'sentiment']).size().unstack(fill_value=0)
-plt.figure(figsize=(14, 6))
-sentiment_timeline.plot(kind='area', stacked=True, 
-                        color=['#2ecc71', '#e74c3c', '#95a5a6'],
-                        alpha=0.7)
-plt.title('Sentiment Trends Over Time', fontsize=16, fontweight='bold')
-plt.xlabel('Month', fontsize=12)
-plt.ylabel('Number of Tweets', fontsize=12)
-plt.legend(title='Sentiment', loc='upper left')
-plt.xticks(rotation=45)
-plt.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.savefig('visualizations/sentiment_timeline.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-# Save sentiment timeline data
-sentiment_timeline_json = {
-    'dates': [str(date) for date in sentiment_timeline.index],
-    'positive': sentiment_timeline['positive'].tolist() if 'positive' in sentiment_timeline else [],
-    'negative': sentiment_timeline['negative'].tolist() if 'negative' in sentiment_timeline else [],
-    'neutral': sentiment_timeline['neutral'].tolist() if 'neutral' in sentiment_timeline else []
-}
-with open('visualizations/sentiment_timeline_data.json', 'w') as f:
-    json.dump(sentiment_timeline_json, f)
+if not stage_done('sentiment_timeline'):
+    print("Generating Sentiment Timeline...")
+    sentiment_timeline = df.groupby(['year_month', 'sentiment']).size().unstack(fill_value=0)
+    plt.figure(figsize=(14, 6))
+    sentiment_timeline.plot(kind='area', stacked=True, 
+                            color=['#2ecc71', '#e74c3c', '#95a5a6'],
+                            alpha=0.7)
+    plt.title('Sentiment Trends Over Time', fontsize=16, fontweight='bold')
+    plt.xlabel('Month', fontsize=12)
+    plt.ylabel('Number of Tweets', fontsize=12)
+    plt.legend(title='Sentiment', loc='upper left')
+    plt.xticks(rotation=45)
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    atomic_savefig('visualizations/sentiment_timeline.png', dpi=300, bbox_inches='tight')
+    plt.close()
+
+    # Save sentiment timeline data
+    sentiment_timeline_json = {
+        'dates': [str(date) for date in sentiment_timeline.index],
+        'positive': sentiment_timeline['positive'].tolist() if 'positive' in sentiment_timeline else [],
+        'negative': sentiment_timeline['negative'].tolist() if 'negative' in sentiment_timeline else [],
+        'neutral': sentiment_timeline['neutral'].tolist() if 'neutral' in sentiment_timeline else []
+    }
+    atomic_write_json('visualizations/sentiment_timeline_data.json', sentiment_timeline_json)
+    complete_stage('sentiment_timeline', ['visualizations/sentiment_timeline.png', 'visualizations/sentiment_timeline_data.json'])
 
 # 5. Engagement Analysis
-print("Generating Engagement Analysis...")
-avg_engagement = df.groupby('sentiment')[['likes', 'retweets']].mean()
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-
-# Likes
-avg_engagement['likes'].plot(kind='bar', ax=ax1, color=['#2ecc71', '#e74c3c', '#95a5a6'], edgecolor='black')
-ax1.set_title('Average Likes by Sentiment', fontsize=14, fontweight='bold')
-ax1.set_xlabel('Sentiment', fontsize=12)
-ax1.set_ylabel('Average Likes', fontsize=12)
-ax1.set_xticklabels(ax1.get_xticklabels(), rotation=0)
-ax1.grid(axis='y', alpha=0.3)
-
-# Retweets
-avg_engagement['retweets'].plot(kind='bar', ax=ax2, color=['#2ecc71', '#e74c3c', '#95a5a6'], edgecolor='black')
-ax2.set_title('Average Retweets by Sentiment', fontsize=14, fontweight='bold')
-ax2.set_xlabel('Sentiment', fontsize=12)
-ax2.set_ylabel('Average Retweets', fontsize=12)
-ax2.set_xticklabels(ax2.get_xticklabels(), rotation=0)
-ax2.grid(axis='y', alpha=0.3)
-
-plt.tight_layout()
-plt.savefig('visualizations/engagement_analysis.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-# Save engagement data
-engagement_data = {
-    'sentiments': avg_engagement.index.tolist(),
-    'likes': avg_engagement['likes'].tolist(),
-    'retweets': avg_engagement['retweets'].tolist()
-}
-with open('visualizations/engagement_data.json', 'w') as f:
-    json.dump(engagement_data, f)
+if not stage_done('engagement'):
+    print("Generating Engagement Analysis...")
+    # Means are skewed by a few viral tweets, so report the distribution too
+    sentiment_stats = engagement_stats(df, ['sentiment'])
+    engagement_stats_json = {
+        'quantiles': ENGAGEMENT_QUANTILES,
+        'by_sentiment': engagement_records(sentiment_stats),
+        'by_sentiment_category_location': engagement_records(
+            engagement_stats(df, ['sentiment', 'category', 'location'])),
+        'top_tweets': {metric: top_tweets(df, metric) for metric in ENGAGEMENT_METRICS}
+    }
+    atomic_write_json('visualizations/engagement_stats.json', engagement_stats_json, indent=2)
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+
+    # Likes
+    sentiment_stats['likes'][['mean', 'median', 'p90']].plot(
+        kind='bar', ax=ax1, color=['#3498db', '#2ecc71', '#e67e22'], edgecolor='black')
+    ax1.set_title('Likes by Sentiment', fontsize=14, fontweight='bold')
+    ax1.set_xlabel('Sentiment', fontsize=12)
+    ax1.set_ylabel('Likes', fontsize=12)
+    ax1.set_xticklabels(ax1.get_xticklabels(), rotation=0)
+    ax1.legend(['Mean', 'Median', '90th percentile'])
+    ax1.grid(axis='y', alpha=0.3)
+
+    # Retweets
+    sentiment_stats['retweets'][['mean', 'median', 'p90']].plot(
+        kind='bar', ax=ax2, color=['#3498db', '#2ecc71', '#e67e22'], edgecolor='black')
+    ax2.set_title('Retweets by Sentiment', fontsize=14, fontweight='bold')
+    ax2.set_xlabel('Sentiment', fontsize=12)
+    ax2.set_ylabel('Retweets', fontsize=12)
+    ax2.set_xticklabels(ax2.get_xticklabels(), rotation=0)
+    ax2.legend(['Mean', 'Median', '90th percentile'])
+    ax2.grid(axis='y', alpha=0.3)
+
+    plt.tight_layout()
+    atomic_savefig('visualizations/engagement_analysis.png', dpi=300, bbox_inches='tight')
+    plt.close()
+
+    # Save engagement data
+    engagement_data = {
+        'sentiments': sentiment_stats.index.tolist(),
+        'likes': sentiment_stats[('likes', 'mean')].tolist(),
+        'retweets': sentiment_stats[('retweets', 'mean')].tolist(),
+        'median_likes': sentiment_stats[('likes', 'median')].tolist(),
+        'median_retweets': sentiment_stats[('retweets', 'median')].tolist()
+    }
+    atomic_write_json('visualizations/engagement_data.json', engagement_data)
+    complete_stage('engagement', ['visualizations/engagement_analysis.png', 'visualizations/engagement_data.json',
+                                  'visualizations/engagement_stats.json'])
 
 # 6. Word Cloud for each sentiment
+# Each sentiment is its own stage: rendering is the slowest step, so a crash
+# halfway through keeps the clouds that already finished.
 print("Generating Word Clouds...")
 for sentiment in ['positive', 'negative', 'neutral']:
+    stage = f'wordcloud_{sentiment}'
+    if stage_done(stage):
+        continue
     text = ' '.join(df[df['sentiment'] == sentiment]['tweet_text'].values)
     # Remove URLs, mentions, hashtags for cleaner wordcloud
     text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
     text = re.sub(r'@\w+|#', '', text)
-    
+    if not re.search(r'\w', text):
+        print(f"No {sentiment} tweets - skipping its word cloud")
+        complete_stage(stage, [])
+        continue
+
     if sentiment == 'positive':
         colormap = 'Greens'
     elif sentiment == 'negative':
         colormap = 'Reds'
     else:
         colormap = 'Greys'
-    
+
     wordcloud = WordCloud(width=800, height=400, 
                           background_color='white',
                           colormap=colormap,
                           max_words=100).generate(text)
-    
+
     plt.figure(figsize=(12, 6))
     plt.imshow(wordcloud, interpolation='bilinear')
     plt.axis('off')
     plt.title(f'Word Cloud - {sentiment.capitalize()} Tweets', fontsize=16, fontweight='bold', pad=20)
     plt.tight_layout()
-    plt.savefig(f'visualizations/wordcloud_{sentiment}.png', dpi=300, bbox_inches='tight')
+    atomic_savefig(f'visualizations/wordcloud_{sentiment}.png', dpi=300, bbox_inches='tight')
     plt.close()
+    complete_stage(stage, [f'visualizations/wordcloud_{sentiment}.png'])
 
 # 7. Location Distribution
-print("Generating Location Distribution...")
-location_counts = df['location'].value_counts()
-plt.figure(figsize=(10, 6))
-plt.pie(location_counts.values, labels=location_counts.index, autopct='%1.1f%%',
-        startangle=90, colors=plt.cm.Set3(range(len(location_counts))))
-plt.title('Tweet Distribution by Location', fontsize=16, fontweight='bold')
-plt.tight_layout()
-plt.savefig('visualizations/location_distribution.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-# Save location data
-location_data = {
-    'labels': location_counts.index.tolist(),
-    'values': location_counts.values.tolist()
-}
-with open('visualizations/location_data.json', 'w') as f:
-    json.dump(location_data, f)
+if not stage_done('location_distribution'):
+    print("Generating Location Distribution...")
+    location_counts = df['location'].value_counts()
+    plt.figure(figsize=(10, 6))
+    plt.pie(location_counts.values, labels=location_counts.index, autopct='%1.1f%%',
+            startangle=90, colors=plt.cm.Set3(range(len(location_counts))))
+    plt.title('Tweet Distribution by Location', fontsize=16, fontweight='bold')
+    plt.tight_layout()
+    atomic_savefig('visualizations/location_distribution.png', dpi=300, bbox_inches='tight')
+    plt.close()
+
+    # Save location data
+    location_data = {
+        'labels': location_counts.index.tolist(),
+        'values': location_counts.values.tolist()
+    }
+    atomic_write_json('visualizations/location_data.json', location_data)
+    complete_stage('location_distribution', ['visualizations/location_distribution.png', 'visualizations/location_data.json'])
 
 # 8. Monthly Category Trends
-print("Generating Monthly Category Trends...")
-category_timeline = df.groupby(['year_month', 'category']).size().unstack(fill_value=0)
-plt.figure(figsize=(14, 8))
-category_timeline.plot(kind='line', marker='o', linewidth=2, markersize=6)
-plt.title('Mental Health Category Trends Over Time', fontsize=16, fontweight='bold')
-plt.xlabel('Month', fontsize=12)
-plt.ylabel('Number of Tweets', fontsize=12)
-plt.legend(title='Category', bbox_to_anchor=(1.05, 1), loc='upper left')
-plt.xticks(rotation=45)
-plt.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.savefig('visualizations/category_timeline.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-# Save category timeline data
-category_timeline_json = {
-    'dates': [str(date) for date in category_timeline.index],
-    'categories': {}
-}
-for col in category_timeline.columns:
-    category_timeline_json['categories'][col] = category_timeline[col].tolist()
-with open('visualizations/category_timeline_data.json', 'w') as f:
-    json.dump(category_timeline_json, f)
+if not stage_done('category_timeline'):
+    print("Generating Monthly Category Trends...")
+    category_timeline = df.groupby(['year_month', 'category']).size().unstack(fill_value=0)
+    plt.figure(figsize=(14, 8))
+    category_timeline.plot(kind='line', marker='o', linewidth=2, markersize=6)
+    plt.title('Mental Health Category Trends Over Time', fontsize=16, fontweight='bold')
+    plt.xlabel('Month', fontsize=12)
+    plt.ylabel('Number of Tweets', fontsize=12)
+    plt.legend(title='Category', bbox_to_anchor=(1.05, 1), loc='upper left')
+    plt.xticks(rotation=45)
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    atomic_savefig('visualizations/category_timeline.png', dpi=300, bbox_inches='tight')
+    plt.close()
+
+    # Save category timeline data
+    category_timeline_json = {
+        'dates': [str(date) for date in category_timeline.index],
+        'categories': {}
+    }
+    for col in category_timeline.columns:
+        category_timeline_json['categories'][col] = category_timeline[col].tolist()
+    atomic_write_json('visualizations/category_timeline_data.json', category_timeline_json)
+    complete_stage('category_timeline', ['visualizations/category_timeline.png', 'visualizations/category_timeline_data.json'])
 
 # 9. Generate Summary Statistics
-print("\nGenerating Summary Statistics...")
-summary_stats = {
-    'total_tweets': len(df),
-    'date_range': {
-        'start': df['date'].min().strftime('%Y-%m-%d'),
-        'end': df['date'].max().strftime('%Y-%m-%d')
-    },
-    'sentiment_distribution': {
-        'positive': int(df[df['sentiment'] == 'positive'].shape[0]),
-        'negative': int(df[df['sentiment'] == 'negative'].shape[0]),
-        'neutral': int(df[df['sentiment'] == 'neutral'].shape[0])
-    },
-    'sentiment_percentages': {
-        'positive': round(df[df['sentiment'] == 'positive'].shape[0] / len(df) * 100, 1),
-        'negative': round(df[df['sentiment'] == 'negative'].shape[0] / len(df) * 100, 1),
-        'neutral': round(df[df['sentiment'] == 'neutral'].shape[0] / len(df) * 100, 1)
-    },
-    'top_categories': df['category'].value_counts().head(5).to_dict(),
-    'total_engagement': {
-        'likes': int(df['likes'].sum()),
-        'retweets': int(df['retweets'].sum())
-    },
-    'avg_engagement': {
-        'likes': round(df['likes'].mean(), 2),
-        'retweets': round(df['retweets'].mean(), 2)
-    },
-    'locations': df['location'].value_counts().to_dict()
-}
+if not stage_done('summary_stats'):
+    print("\nGenerating Summary Statistics...")
+    summary_stats = {
+        'total_tweets': len(df),
+        'date_range': {
+            'start': df['date'].min().strftime('%Y-%m-%d'),
+            'end': df['date'].max().strftime('%Y-%m-%d')
+        },
+        'sentiment_distribution': {
+            'positive': int(df[df['sentiment'] == 'positive'].shape[0]),
+            'negative': int(df[df['sentiment'] == 'negative'].shape[0]),
+            'neutral': int(df[df['sentiment'] == 'neutral'].shape[0])
+        },
+        'sentiment_percentages': {
+            'positive': round(df[df['sentiment'] == 'positive'].shape[0] / len(df) * 100, 1),
+            'negative': round(df[df['sentiment'] == 'negative'].shape[0] / len(df) * 100, 1),
+            'neutral': round(df[df['sentiment'] == 'neutral'].shape[0] / len(df) * 100, 1)
+        },
+        'top_categories': df['category'].value_counts().head(5).to_dict(),
+        'total_engagement': {
+            'likes': int(df['likes'].sum()),
+            'retweets': int(df['retweets'].sum())
+        },
+        'avg_engagement': {
+            'likes': round(df['likes'].mean(), 2),
+            'retweets': round(df['retweets'].mean(), 2)
+        },
+        'locations': df['location'].value_counts().to_dict()
+    }
 
-with open('visualizations/summary_stats.json', 'w') as f:
-    json.dump(summary_stats, f, indent=2)
+    atomic_write_json('visualizations/summary_stats.json', summary_stats, indent=2)
+    complete_stage('summary_stats', ['visualizations/summary_stats.json'])
+else:
+    with open('visualizations/summary_stats.json') as f:
+        summary_stats = json.load(f)
 
 print("\n" + "="*50)
 print("Analysis Complete!")
 print("="*50)
 print(f"\nAll visualizations saved in 'visualizations/' folder")
+if skipped_stages:
+    print(f"Reused {len(skipped_stages)} checkpointed stages: {', '.join(skipped_stages)}")
+    print("Run with --fresh to regenerate everything")
 print(f"JSON data files created for web dashboard")
 print("\nSummary Statistics:")
 print(f"- Total Tweets: {summary_stats['total_tweets']}")
@@ -3,6 +3,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from wordcloud import WordCloud
 import re
+import json
 import os
 
 # Set style
@@ -112,25 +113,27 @@ plt.close()
 print("6. Creating Engagement Analysis chart...")
 fig, axes = plt.subplots(2, 2, figsize=(15, 10))
 
-avg_likes = df.groupby('sentiment')['likes'].mean()
-axes[0, 0].bar(avg_likes.index, avg_likes.values, color=['#2ecc71', '#e74c3c', '#95a5a6'], edgecolor='black', linewidth=1.5)
-axes[0, 0].set_title('Average Likes by Sentiment', fontsize=14, fontweight='bold')
-axes[0, 0].set_ylabel('Average Likes', fontsize=12)
-axes[0, 0].grid(axis='y', alpha=0.3)
-
-avg_retweets = df.groupby('sentiment')['retweets'].mean()
-axes[0, 1].bar(avg_retweets.index, avg_retweets.values, color=['#2ecc71', '#e74c3c', '#95a5a6'], edgecolor='black', linewidth=1.5)
-axes[0, 1].set_title('Average Retweets by Sentiment', fontsize=14, fontweight='bold')
-axes[0, 1].set_ylabel('Average Retweets', fontsize=12)
-axes[0, 1].grid(axis='y', alpha=0.3)
-
-engagement_data = df.groupby('sentiment')[['likes', 'retweets']].mean()
-x = range(len(engagement_data))
+# Distribution statistics are computed by analyze_tweets.py
+with open('visualizations/engagement_stats.json') as f:
+    engagement_stats = pd.json_normalize(json.load(f)['by_sentiment']).set_index('sentiment')
+stat_labels = {'mean': 'Mean', 'median': 'Median', 'p90': '90th percentile'}
+
+for ax, metric in [(axes[0, 0], 'likes'), (axes[0, 1], 'retweets')]:
+    metric_stats = engagement_stats[[f'{metric}.{stat}' for stat in stat_labels]]
+    metric_stats.columns = list(stat_labels.values())
+    metric_stats.plot(kind='bar', ax=ax, color=['#3498db', '#2ecc71', '#e67e22'], edgecolor='black', linewidth=1.5, rot=0)
+    ax.set_title(f'{metric.capitalize()} by Sentiment', fontsize=14, fontweight='bold')
+    ax.set_xlabel('')
+    ax.set_ylabel(metric.capitalize(), fontsize=12)
+    ax.legend(fontsize=11)
+    ax.grid(axis='y', alpha=0.3)
+
+x = range(len(engagement_stats))
 width = 0.35
-axes[1, 0].bar([i - width/2 for i in x], engagement_data['likes'], width, label='Likes', color='#3498db', edgecolor='black')
-axes[1, 0].bar([i + width/2 for i in x], engagement_data['retweets'], width, label='Retweets', color='#e67e22', edgecolor='black')
+axes[1, 0].bar([i - width/2 for i in x], engagement_stats['likes.mean'], width, label='Likes', color='#3498db', edgecolor='black')
+axes[1, 0].bar([i + width/2 for i in x], engagement_stats['retweets.mean'], width, label='Retweets', color='#e67e22', edgecolor='black')
 axes[1, 0].set_xticks(x)
-axes[1, 0].set_xticklabels(engagement_data.index)
+axes[1, 0].set_xticklabels(engagement_stats.index)
 axes[1, 0].set_title('Engagement Comparison', fontsize=14, fontweight='bold')
 axes[1, 0].set_ylabel('Average Count', fontsize=12)
 axes[1, 0].legend(fontsize=11)
@@ -59,11 +59,13 @@ with open('visualizations/sentiment_timeline_data.json', 'w') as f:
 print("✓ Sentiment timeline data")
 
 # 5. Engagement data
-avg_engagement = df.groupby('sentiment')[['likes', 'retweets']].mean()
+engagement = df.groupby('sentiment')[['likes', 'retweets']].agg(['mean', 'median'])
 engagement_data = {
-    'sentiments': avg_engagement.index.tolist(),
-    'likes': avg_engagement['likes'].tolist(),
-    'retweets': avg_engagement['retweets'].tolist()
+    'sentiments': engagement.index.tolist(),
+    'likes': engagement[('likes', 'mean')].tolist(),
+    'retweets': engagement[('retweets', 'mean')].tolist(),
+    'median_likes': engagement[('likes', 'median')].tolist(),
+    'median_retweets': engagement[('retweets', 'median')].tolist()
 }
 with open('visualizations/engagement_data.json', 'w') as f:
     json.dump(engagement_data, f)